@@ -5,7 +5,12 @@ import asyncio
 import socket
 
 import aiohttp
-import async_timeout
+
+_API_URL = "https://jsonplaceholder.typicode.com/posts/1"
+_JSON_HEADERS = {"Content-type": "application/json; charset=UTF-8"}
+_REQUEST_TIMEOUT = aiohttp.ClientTimeout(
+    total=30, connect=5, sock_connect=5, sock_read=10
+)
 
 
 class IntegrationBlueprintApiClientError(Exception):
@@ -40,17 +45,15 @@ class IntegrationBlueprintApiClient:
 
     async def async_get_data(self) -> any:
         """Get data from the API."""
-        return await self._api_wrapper(
-            method="get", url="https://jsonplaceholder.typicode.com/posts/1"
-        )
+        return await self._api_wrapper(method="get", url=_API_URL)
 
     async def async_set_title(self, value: str) -> any:
         """Get data from the API."""
         return await self._api_wrapper(
             method="patch",
-            url="https://jsonplaceholder.typicode.com/posts/1",
+            url=_API_URL,
             data={"title": value},
-            headers={"Content-type": "application/json; charset=UTF-8"},
+            headers=_JSON_HEADERS,
         )
 
     async def _api_wrapper(
@@ -62,19 +65,19 @@ class IntegrationBlueprintApiClient:
     ) -> any:
         """Get information from the API."""
         try:
-            async with async_timeout.timeout(10):
-                response = await self._session.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    json=data,
+            response = await self._session.request(
+                method=method,
+                url=url,
+                headers=headers,
+                json=data,
+                timeout=_REQUEST_TIMEOUT,
+            )
+            if response.status in (401, 403):
+                raise IntegrationBlueprintApiClientAuthenticationError(
+                    "Invalid credentials",
                 )
-                if response.status in (401, 403):
-                    raise IntegrationBlueprintApiClientAuthenticationError(
-                        "Invalid credentials",
-                    )
-                response.raise_for_status()
-                return await response.json()
+            response.raise_for_status()
+            return await response.json()
 
         except asyncio.TimeoutError as exception:
             raise IntegrationBlueprintApiClientCommunicationError(
@@ -1,9 +1,10 @@
 """Constants for integration_blueprint."""
 from logging import Logger, getLogger
+from typing import Final
 
-LOGGER: Logger = getLogger(__package__)
+LOGGER: Final[Logger] = getLogger(__package__)
 
-NAME = "Integration blueprint"
-DOMAIN = "integration_blueprint"
-VERSION = "0.0.0"
-ATTRIBUTION = "Data provided by http://jsonplaceholder.typicode.com/"
+NAME: Final = "Integration blueprint"
+DOMAIN: Final = "integration_blueprint"
+VERSION: Final = "0.0.0"
+ATTRIBUTION: Final = "Data provided by http://jsonplaceholder.typicode.com/"